@@ -0,0 +1,7 @@
+"""Django settings used when running the test suite."""
+from .settings import *  # noqa: F401,F403
+
+# Hashing passwords with a cheap algorithm keeps user creation fast in tests.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
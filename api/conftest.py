@@ -1,22 +1,108 @@
 """Common test fixtures for this project."""
+import logging
+from uuid import uuid4
+
 import pytest
 from django.contrib.auth import get_user_model
-from model_bakery import baker
-from rest_framework.test import APIClient
+from django.test import Client
+from rest_framework.test import APIClient, APIRequestFactory
 
 User = get_user_model()
 
 
+# Tests allowed to use a transactional database, mapped to the reason they need
+# one. Add a test here only if savepoint rollback cannot work for it, such as
+# code that commits or runs on_commit callbacks.
+TRANSACTIONAL_TESTS = {
+    "profiles/tests/test_migrations.py::TestFollowCountsMigration::"
+    "test_backfill_sets_counts_of_existing_profiles": (
+        "Applies migrations, which cannot run inside the test's savepoint."
+    ),
+}
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Fail the run if a test flushes the database instead of rolling back.
+
+    Transactional tests truncate every table after they run, which is far slower
+    than the savepoint rollback used by plain django_db tests. A test needing one
+    must be listed in TRANSACTIONAL_TESTS with the reason.
+    """
+    for item in items:
+        marker = item.get_closest_marker("django_db")
+        uses_transactions = "transactional_db" in item.fixturenames or (
+            marker and marker.kwargs.get("transaction")
+        )
+        if uses_transactions and item.nodeid not in TRANSACTIONAL_TESTS:
+            raise pytest.UsageError(
+                f"{item.nodeid} uses a transactional database; use django_db, "
+                "or add it to TRANSACTIONAL_TESTS in conftest.py with the reason."
+            )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def disable_logging():
+    """Drop log records, such as the warning logged for every 4xx response."""
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
 @pytest.fixture
 def api_client():
     """Return an API client object."""
     return APIClient()
 
 
+@pytest.fixture(scope="session")
+def api_rf():
+    """Return a request factory, for calling views without the middleware."""
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def plain_client():
+    """Return a Django test client for anonymous requests."""
+    return Client()
+
+
 @pytest.fixture
-def sample_user():
+def user_client(api_client, sample_user):
+    """Return an API client authenticated as the sample user."""
+    api_client.force_authenticate(user=sample_user)
+    return api_client
+
+
+@pytest.fixture
+def user_factory():
+    """
+    Return a function creating users with a unique username and email.
+
+    Users are inserted with bulk_create, which skips the save signals that
+    none of the tests using this factory rely on.
+    """
+
+    def _user_factory(**kwargs):
+        username = f"user_{uuid4().hex[:12]}"
+        kwargs.setdefault("username", username)
+        kwargs.setdefault("email", f"{username}@example.com")
+        (user,) = User.objects.bulk_create([User(**kwargs)])
+        return user
+
+    return _user_factory
+
+
+@pytest.fixture
+def sample_user(user_factory):
     """Create and return a sample user."""
-    return baker.make(User)
+    return user_factory()
+
+
+@pytest.fixture
+def nodb_sample_user():
+    """Return an unsaved user, for requests rejected before the user is queried."""
+    return User(pk=1, username="nodb_user", email="nodb_user@example.com")
 
 
 @pytest.fixture
@@ -7,3 +7,7 @@ class ProfilesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "profiles"
+
+    def ready(self):
+        """Register the app's signal handlers."""
+        from . import signals  # noqa: F401
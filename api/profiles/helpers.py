@@ -1,32 +1,83 @@
 """Helpers for the profiles app."""
-from django.db.models import BooleanField, Case, Exists, OuterRef, Value, When
-from django.shortcuts import get_object_or_404
+from django.db.models import Exists, F, OuterRef
+from rest_framework.generics import get_object_or_404
 from rest_framework.serializers import ValidationError
 
 from .models import Follow, Profile
+from .serializers import serialize_simple_user_profiles
 
 
-class ProfileViewSetHelper:
-    """Helper functions for the ProfileViewSet."""
+def get_request_profile(request):
+    """
+    Return the profile of the request's user, or None if they do not have one.
 
-    def add_follow_fields(self, instance, current_profile):
-        """Add is_following and follows_you fields to instance."""
-        if current_profile:
-            follows_filter = {"pk": instance.pk}
-            instance.is_following = current_profile.follows.filter(
-                **follows_filter
-            ).exists()
-            instance.follows_you = current_profile.followed_by.filter(
-                **follows_filter
-            ).exists()
+    The profile is looked up at most once per request and is kept on the request,
+    so everything handling the request shares one instance.
+    """
+    user = request.user
 
-        return instance
+    if user.is_anonymous:
+        return None
+
+    if not hasattr(request, "_current_profile"):
+        request._current_profile = (
+            Profile.objects.select_related("user")
+            .only("id", "user__id", "user__first_name", "user__last_name")
+            .filter(user=user)
+            .first()
+        )
+
+    return request._current_profile
 
-    def add_follow_counts(self, instance):
-        """Add following and followers counts to instance."""
-        instance.following_count = instance.follows.count()
-        instance.followers_count = instance.followed_by.count()
-        return instance
+
+class ProfileViewSetHelper:
+    """Helper functions for the ProfileViewSet."""
+
+    def add_follow_fields_in_bulk(
+        self, profiles, current_profile, is_following=None, follows_you=None
+    ):
+        """
+        Add is_following and follows_you fields to every profile in profiles.
+
+        Pass is_following or follows_you when the listed profiles are already known
+        to share that value, so it is not queried.
+        """
+        ids = [profile.pk for profile in profiles]
+        if is_following is None:
+            followed_ids = set(
+                Follow.objects.filter(
+                    follower=current_profile, following_id__in=ids
+                ).values_list("following_id", flat=True)
+            )
+        if follows_you is None:
+            follower_ids = set(
+                Follow.objects.filter(
+                    following=current_profile, follower_id__in=ids
+                ).values_list("follower_id", flat=True)
+            )
+
+        for profile in profiles:
+            # Follow fields do not apply to the current user's own profile.
+            if profile.pk == current_profile.pk:
+                profile.is_following = profile.follows_you = None
+                continue
+            if is_following is None:
+                profile.is_following = profile.pk in followed_ids
+            else:
+                profile.is_following = is_following
+            if follows_you is None:
+                profile.follows_you = profile.pk in follower_ids
+            else:
+                profile.follows_you = follows_you
+
+        return profiles
+
+    def annotate_follow_counts(self, queryset):
+        """Annotate profiles in queryset with following and followers counts."""
+        return queryset.annotate(
+            following_count=F("following_count_cached"),
+            followers_count=F("followers_count_cached"),
+        )
 
     def get_profiles_with_follow_info(self):
         """Return a queryset of profiles annotated with follow information."""
@@ -36,72 +87,83 @@ class ProfileViewSetHelper:
             raise ValidationError({"detail": "Profile not found for current user."})
 
         return Profile.objects.annotate(
-            is_following=Case(
-                When(pk=current_profile.pk, then=Value(None)),
-                default=Exists(
-                    Follow.objects.filter(
-                        following=OuterRef("pk"),
-                        follower=current_profile,
-                    ),
+            is_following=Exists(
+                Follow.objects.filter(
+                    following=OuterRef("pk"),
+                    follower=current_profile,
                 ),
-                output_field=BooleanField(),
             ),
-            follows_you=Case(
-                When(pk=current_profile.pk, then=Value(None)),
-                default=Exists(
-                    Follow.objects.filter(
-                        follower=OuterRef("pk"),
-                        following=current_profile,
-                    ),
+            follows_you=Exists(
+                Follow.objects.filter(
+                    follower=OuterRef("pk"),
+                    following=current_profile,
                 ),
-                output_field=BooleanField(),
             ),
         )
 
     def get_current_profile(self):
         """Return the current user's profile."""
-        user = self.request.user
-
-        if user.is_anonymous:
-            return None
+        return get_request_profile(self.request)
 
-        if not hasattr(self, "_current_profile"):
-            self._current_profile = Profile.objects.filter(user=user).first()
-
-        return self._current_profile
-
-    def get_me_object(self):
-        """Get the profile object for the "me" action."""
-        if self.request.method == "DELETE":
-            return get_object_or_404(Profile, user=self.request.user)
-
-        profile, _ = Profile.objects.get_or_create(user=self.request.user)
+    def get_or_create_current_profile(self):
+        """Return the current user's profile, creating it if it does not exist."""
+        # Responses may nest the user, so load it with an existing profile.
+        profile, _ = Profile.objects.select_related("user").get_or_create(
+            user=self.request.user
+        )
         return profile
 
+    def is_current_profile(self, profile):
+        """Return whether profile belongs to the current user."""
+        current_profile = self.get_current_profile()
+        return current_profile is not None and current_profile.pk == profile.pk
+
     def get_retrieve_object(self):
         """Get the profile object for the "retrieve" action."""
-        instance = super().get_object()
         current_profile = self.get_current_profile()
+        pk = self.kwargs["pk"]
+        is_own_profile = bool(current_profile) and str(current_profile.pk) == pk
+
+        # Add extra follow fields and counts as long as the current user is not
+        # viewing their own profile. They are annotated on the same query that
+        # fetches the profile.
+        if current_profile and not is_own_profile:
+            queryset = self.get_profiles_with_follow_info()
+        else:
+            queryset = Profile.objects.all()
+
+        if not is_own_profile:
+            queryset = self.annotate_follow_counts(queryset)
+
+        instance = get_object_or_404(queryset.select_related("user"), pk=pk)
+        self.check_object_permissions(self.request, instance)
+        return instance
 
-        # Add extra follow fields as long as the current user is not viewing
-        # their own profile.
-        if current_profile != instance:
-            instance = self.add_follow_fields(instance, current_profile)
-            instance = self.add_follow_counts(instance)
+    def get_profiles_in_queryset(self, queryset, **known_follow_fields):
+        """
+        Return a paginated response listing the profiles in queryset.
 
-        return instance
+        known_follow_fields are passed on to add_follow_fields_in_bulk.
+        """
+        current_profile = self.get_current_profile()
+
+        if not current_profile:
+            raise ValidationError({"detail": "Profile not found for current user."})
 
-    def get_profiles_in_queryset(self, queryset):
-        """Return all profiles whose id is in a specified queryset."""
-        profiles = (
-            self.get_profiles_with_follow_info()
-            .select_related("user")
-            .filter(id__in=queryset)
-            .order_by("id")
+        profiles = queryset.select_related("user").only(
+            "id",
+            "bio",
+            "is_verified",
+            "image",
+            "user__username",
+            "user__first_name",
+            "user__last_name",
         )
 
         paginator = self.pagination_class()
-        paginator.page_size = 40
         paginated_profiles = paginator.paginate_queryset(profiles, self.request)
-        serializer = self.get_serializer(paginated_profiles, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        self.add_follow_fields_in_bulk(
+            paginated_profiles, current_profile, **known_follow_fields
+        )
+        data = serialize_simple_user_profiles(paginated_profiles, self.request)
+        return paginator.get_paginated_response(data)
@@ -0,0 +1 @@
+"""This package contains management tools for the profiles app."""
@@ -0,0 +1 @@
+"""This package contains custom management commands for the profiles app."""
@@ -0,0 +1,15 @@
+"""Recount the cached follow counts of profiles."""
+from django.core.management.base import BaseCommand
+
+from profiles.models import recount_follow_counts
+
+
+class Command(BaseCommand):
+    """Command to recount every profile's cached follow counts."""
+
+    help = "Recount the cached follow counts of profiles from the Follow table."
+
+    def handle(self, *args, **options):
+        """Entry point for command."""
+        updated = recount_follow_counts()
+        self.stdout.write(self.style.SUCCESS(f"Recounted {updated} profiles."))
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("profiles", "0004_profile_follows"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="follow",
+            index=models.Index(
+                fields=["following", "follower"], name="follow_following_follower_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.1.7 on 2026-10-16 11:40
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_follow_counts(apps, schema_editor):
+    """Set the cached follow counts of existing profiles."""
+    Follow = apps.get_model("profiles", "Follow")
+    Profile = apps.get_model("profiles", "Profile")
+
+    def count_follows(field):
+        follows = (
+            Follow.objects.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return Coalesce(Subquery(follows), 0)
+
+    Profile.objects.update(
+        following_count_cached=count_follows("follower"),
+        followers_count_cached=count_follows("following"),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("profiles", "0005_follow_follow_following_follower_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profile",
+            name="followers_count_cached",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="profile",
+            name="following_count_cached",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_follow_counts, migrations.RunPython.noop),
+    ]
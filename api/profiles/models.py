@@ -1,9 +1,11 @@
 """Profile app models."""
 import os
 import uuid
+from functools import cached_property
 
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 
 from .validators import validate_age, validate_image_size
@@ -13,8 +15,8 @@ User = get_user_model()
 
 def profile_image_file_path(instance, filename):
     """Generate file path for new profile image."""
-    ext = filename.split(".")[-1]
-    filename = f"{uuid.uuid4()}.{ext}"
+    ext = os.path.splitext(filename)[1].lstrip(".").lower()
+    filename = f"{uuid.uuid4().hex}.{ext}"
 
     return os.path.join("uploads/profile/", filename)
 
@@ -37,6 +39,11 @@ class Profile(models.Model):
     )
     is_verified = models.BooleanField(_("verified"), default=False)
     is_suspended = models.BooleanField(default=False)
+    # Maintained by the profiles app's Follow signal handlers. Writes that skip
+    # signals, such as Follow.objects.bulk_create(), queryset update() or raw SQL,
+    # leave them stale: run the recount_follows command afterwards.
+    following_count_cached = models.PositiveIntegerField(default=0)
+    followers_count_cached = models.PositiveIntegerField(default=0)
     follows = models.ManyToManyField(
         "self",
         through="Follow",
@@ -44,7 +51,7 @@ class Profile(models.Model):
         related_name="followed_by",
     )
 
-    @property
+    @cached_property
     def full_name(self):
         """Return a concatenation of the profile user's first and last names."""
         return f"{self.user.first_name} {self.user.last_name}"
@@ -77,7 +84,39 @@ class Follow(models.Model):
                 name="no_self_follow",
             ),
         ]
+        # The unique_follow constraint already indexes (follower, following).
+        indexes = [
+            models.Index(
+                fields=["following", "follower"], name="follow_following_follower_idx"
+            ),
+        ]
 
     def __str__(self):
         """Return follow description."""
         return f"{self.follower} follows {self.following}"
+
+
+def recount_follow_counts(profiles=None):
+    """
+    Recount the cached follow counts of profiles from the Follow table.
+
+    Recounts every profile unless a `profiles` queryset is given. Use this after
+    writing follows in ways that do not send the model signals.
+    """
+
+    def count_follows(field):
+        follows = (
+            Follow.objects.filter(**{field: models.OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return Coalesce(models.Subquery(follows), 0)
+
+    if profiles is None:
+        profiles = Profile.objects.all()
+    return profiles.update(
+        following_count_cached=count_follows("follower"),
+        followers_count_cached=count_follows("following"),
+    )
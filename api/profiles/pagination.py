@@ -0,0 +1,15 @@
+"""Pagination classes for the profiles app."""
+from rest_framework.pagination import CursorPagination
+
+
+class ProfileListCursorPagination(CursorPagination):
+    """
+    Cursor pagination for profile lists, ordered by id.
+
+    Pages are fetched by id rather than by offset, so later pages of long lists
+    cost the same as the first one. Responses link pages through `next` and
+    `previous` cursors and carry no total `count`.
+    """
+
+    ordering = "id"
+    page_size = 40
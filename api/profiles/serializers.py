@@ -1,9 +1,14 @@
 """Serializers for the Profiles app."""
+from collections.abc import Mapping
+
 from django.contrib.auth import get_user_model
-from django.shortcuts import get_object_or_404
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Exists
+from django.http import Http404
 from rest_framework import serializers
 
 from .models import Follow, Profile
+from .validators import validate_image_size
 
 User = get_user_model()
 
@@ -55,6 +60,39 @@ class SimpleUserProfileSerializer(serializers.ModelSerializer):
         ]
 
 
+def serialize_simple_user_profiles(profiles, request=None):
+    """
+    Return the data SimpleUserProfileSerializer returns for many `profiles`.
+
+    The dictionaries are built directly, skipping DRF's per-field work, since the
+    follow lists serialize a whole page of profiles per request.
+    """
+
+    def image_url(image):
+        if not image:
+            return None
+        if request is None:
+            return image.url
+        return request.build_absolute_uri(image.url)
+
+    return [
+        {
+            "id": profile.id,
+            "user": {
+                "username": profile.user.username,
+                "first_name": profile.user.first_name,
+                "last_name": profile.user.last_name,
+            },
+            "bio": profile.bio,
+            "is_verified": profile.is_verified,
+            "image": image_url(profile.image),
+            "is_following": profile.is_following,
+            "follows_you": profile.follows_you,
+        }
+        for profile in profiles
+    ]
+
+
 class UserProfileSerializer(SimpleUserProfileSerializer):
     """Serializer for the profile model."""
 
@@ -124,6 +162,16 @@ class ProfileImageSerializer(serializers.ModelSerializer):
         fields = ["id", "image"]
         read_only_fields = ["id"]
 
+    def to_internal_value(self, data):
+        """Reject oversized images before Pillow reads them."""
+        image = data.get("image") if isinstance(data, Mapping) else None
+        if hasattr(image, "size"):
+            try:
+                validate_image_size(image)
+            except DjangoValidationError as exc:
+                raise serializers.ValidationError({"image": exc.messages})
+        return super().to_internal_value(data)
+
 
 class CreateFollowSerializer(serializers.ModelSerializer):
     """Serializer for creating follows."""
@@ -142,13 +190,22 @@ class CreateFollowSerializer(serializers.ModelSerializer):
 
     def validate_following_id(self, value):
         """Ensure `value` is a valid following ID for the current user's profile."""
-        get_object_or_404(Profile, id=value)
         current_profile = self.context.get("current_profile")
-        follow_exists = Follow.objects.filter(
-            follower=current_profile, following_id=value
-        ).exists()
-        if follow_exists:
-            raise serializers.ValidationError("You are already following this profile.")
         if current_profile.id == value:
             raise serializers.ValidationError("You cannot follow yourself.")
+
+        following = (
+            Profile.objects.filter(id=value)
+            .annotate(
+                follow_exists=Exists(
+                    Follow.objects.filter(follower=current_profile, following_id=value)
+                )
+            )
+            .values("follow_exists")
+            .first()
+        )
+        if following is None:
+            raise Http404
+        if following["follow_exists"]:
+            raise serializers.ValidationError("You are already following this profile.")
         return value
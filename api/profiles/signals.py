@@ -0,0 +1,51 @@
+"""Signal handlers for the profiles app."""
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Follow, Profile
+
+
+def add_to_follow_count(profile_ids, field, amount):
+    """Add `amount` to the cached follow count `field` of profiles in profile_ids."""
+    Profile.objects.filter(pk__in=profile_ids).update(
+        **{field: Greatest(F(field) + amount, 0)}
+    )
+
+
+@receiver(post_save, sender=Follow)
+def count_created_follow(sender, instance, created, **kwargs):
+    """Update the cached follow counts of both profiles of a new follow."""
+    if created:
+        add_to_follow_count([instance.follower_id], "following_count_cached", 1)
+        add_to_follow_count([instance.following_id], "followers_count_cached", 1)
+
+
+@receiver(post_delete, sender=Follow)
+def count_deleted_follow(sender, instance, **kwargs):
+    """Update the cached follow counts of both profiles of a deleted follow."""
+    add_to_follow_count([instance.follower_id], "following_count_cached", -1)
+    add_to_follow_count([instance.following_id], "followers_count_cached", -1)
+
+
+@receiver(m2m_changed, sender=Follow)
+def count_added_follows(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Update cached follow counts for follows added via `follows` or `followed_by`.
+
+    Those managers bulk create follows, which does not send post_save. Removing
+    follows through them deletes each follow, which post_delete handles.
+    """
+    if action != "post_add" or not pk_set:
+        return
+
+    if reverse:
+        # instance.followed_by.add(*followers)
+        add_to_follow_count([instance.pk], "followers_count_cached", len(pk_set))
+        add_to_follow_count(pk_set, "following_count_cached", 1)
+    else:
+        # instance.follows.add(*followed)
+        add_to_follow_count([instance.pk], "following_count_cached", len(pk_set))
+        add_to_follow_count(pk_set, "followers_count_cached", 1)
+
@@ -1,67 +1,108 @@
 """Profiles app test fixtures."""
+from functools import lru_cache, partial
+from io import BytesIO
+from uuid import uuid4
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from django.utils import timezone
-from model_bakery import baker
-from profiles.models import Profile
+from PIL import Image
+from profiles.models import Follow, Profile
 
 User = get_user_model()
+DATE_FROM_14_YEARS_AGO = timezone.now().date() - timezone.timedelta(days=365 * 14)
+PROFILE_PAYLOAD = {
+    "bio": "sample description",
+    "location": "sample location",
+    "birth_date": DATE_FROM_14_YEARS_AGO,
+    "website": "https://some-website.com",
+}
+EXTRA_KEYS = frozenset(
+    ["is_following", "follows_you", "followers_count", "following_count"]
+)
+
+
+def make_jpeg_upload():
+    """Return a small JPEG image as an uploaded file."""
+    buffer = BytesIO()
+    Image.new("RGB", (10, 10)).save(buffer, format="JPEG")
+    return SimpleUploadedFile("image.jpg", buffer.getvalue(), content_type="image/jpeg")
+
+
+JPEG_UPLOAD = make_jpeg_upload()
+
+
+@lru_cache(maxsize=None)
+def reverse_with_id(viewname, object_id):
+    """Return the URL of `viewname` for an object's id, resolving it only once."""
+    return reverse(viewname, args=[object_id])
 
 
 @pytest.fixture
 def detail_url():
     """Return profile detail URL."""
+    return partial(reverse_with_id, "profiles:profile-detail")
 
-    def _detail_url(profile_id):
-        return reverse("profiles:profile-detail", args=[profile_id])
 
-    return _detail_url
+@pytest.fixture
+def profile_payload():
+    """Return a copy of the sample profile payload, safe for tests to update."""
+    return dict(PROFILE_PAYLOAD)
 
 
 @pytest.fixture
-def profile_payload():
-    """Return sample profile information as a payload."""
-    date_from_14_years_ago = timezone.now().date() - timezone.timedelta(days=365 * 14)
-    payload = {
-        "bio": "sample description",
-        "location": "sample location",
-        "birth_date": date_from_14_years_ago,
-        "website": "https://some-website.com",
-    }
-    return payload
+def media_root(settings, tmp_path):
+    """Store uploaded files in a temporary directory removed after the test."""
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
 
 
 @pytest.fixture
-def image_url():
-    """Return profile image upload URL."""
+def jpeg_upload():
+    """Return the shared JPEG upload, rewound to its start."""
+    JPEG_UPLOAD.seek(0)
+    return JPEG_UPLOAD
 
-    def _image_url(profile_id):
-        return reverse("profiles:profile-admin-upload-image", args=[profile_id])
 
-    return _image_url
+@pytest.fixture
+def image_url():
+    """Return profile image upload URL."""
+    return partial(reverse_with_id, "profiles:profile-admin-upload-image")
 
 
 @pytest.fixture
 def follow_detail_url():
     """Return the follow detail URL."""
-
-    def _follow_detail_url(follow_id):
-        return reverse("profiles:follow-detail", args=[follow_id])
-
-    return _follow_detail_url
+    return partial(reverse_with_id, "profiles:follow-detail")
 
 
 @pytest.fixture
 def sample_profile(sample_user):
     """Return a sample profile."""
-    return baker.make(Profile, user=sample_user)
+    return Profile.objects.create(user=sample_user)
 
 
 @pytest.fixture
-def other_profile():
+def other_profile(user_factory):
     """Return a sample profile."""
-    return baker.make(Profile)
+    return Profile.objects.create(user=user_factory())
+
+
+@pytest.fixture(scope="session")
+def profile_factory():
+    """Return a function creating a number of profiles with two queries."""
+
+    def _profile_factory(quantity):
+        usernames = [f"user_{uuid4().hex[:12]}" for _ in range(quantity)]
+        users = User.objects.bulk_create(
+            User(username=username, email=f"{username}@example.com")
+            for username in usernames
+        )
+        return Profile.objects.bulk_create(Profile(user=user) for user in users)
+
+    return _profile_factory
 
 
 @pytest.fixture
@@ -70,20 +111,22 @@ def follow_payload(other_profile):
     return {"following_id": other_profile.id}
 
 
+@pytest.fixture
+def preexisting_follow(sample_profile, other_profile):
+    """Return a follow of other_profile by sample_profile."""
+    (follow,) = Follow.objects.bulk_create(
+        [Follow(follower=sample_profile, following=other_profile)]
+    )
+    return follow
+
+
 @pytest.fixture
 def pop_extra_keys():
     """Pop extra keys from a dictionary."""
 
     def _pop_extra_keys(dictionary):
-        keys = [
-            "is_following",
-            "follows_you",
-            "followers_count",
-            "following_count",
-        ]
-        for key in keys:
-            if key in dictionary:
-                dictionary.pop(key)
+        for key in EXTRA_KEYS:
+            dictionary.pop(key, None)
         return dictionary
 
     return _pop_extra_keys
@@ -92,28 +135,16 @@ def pop_extra_keys():
 @pytest.fixture
 def followers_list_url():
     """Return the followers list URL."""
-
-    def _followers_list_url(profile_id):
-        return reverse("profiles:profile-followers", args=[profile_id])
-
-    return _followers_list_url
+    return partial(reverse_with_id, "profiles:profile-followers")
 
 
 @pytest.fixture
 def following_list_url():
     """Return the following list URL."""
-
-    def _following_list_url(profile_id):
-        return reverse("profiles:profile-following", args=[profile_id])
-
-    return _following_list_url
+    return partial(reverse_with_id, "profiles:profile-following")
 
 
 @pytest.fixture
 def followers_i_know_list_url():
     """Return followers i know list URL."""
-
-    def _followers_i_know_list_url(profile_id):
-        return reverse("profiles:profile-followers-i-know", args=[profile_id])
-
-    return _followers_i_know_list_url
+    return partial(reverse_with_id, "profiles:profile-followers-i-know")
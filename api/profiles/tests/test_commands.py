@@ -0,0 +1,29 @@
+"""Tests for the profiles app management commands."""
+import pytest
+from django.core.management import call_command
+from profiles.models import Follow
+
+
+@pytest.mark.django_db
+class TestRecountFollows:
+    """Test the recount_follows command."""
+
+    def test_recount_follows_fixes_counts_of_bulk_created_follows(
+        self, other_profile, profile_factory, sample_profile
+    ):
+        """Test follows created without signals are counted by the command."""
+        (profile,) = profile_factory(1)
+        Follow.objects.bulk_create(
+            [
+                Follow(follower=sample_profile, following=other_profile),
+                Follow(follower=profile, following=other_profile),
+            ]
+        )
+
+        call_command("recount_follows")
+
+        sample_profile.refresh_from_db()
+        other_profile.refresh_from_db()
+        assert sample_profile.following_count_cached == 1
+        assert sample_profile.followers_count_cached == 0
+        assert other_profile.followers_count_cached == 2
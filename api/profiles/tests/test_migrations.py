@@ -0,0 +1,59 @@
+"""Tests for the profiles app data migrations."""
+import pytest
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+BEFORE_COUNTS = [("profiles", "0005_follow_follow_following_follower_idx")]
+AFTER_COUNTS = [("profiles", "0006_profile_followers_count_cached_and_more")]
+
+
+def migrate(targets):
+    """Migrate the database to targets and return the resulting app registry."""
+    executor = MigrationExecutor(connection)
+    executor.migrate(targets)
+    executor.loader.build_graph()
+    return executor.loader.project_state(targets).apps
+
+
+# Schema changes cannot run alongside the savepoints of a plain django_db test.
+@pytest.mark.django_db(transaction=True)
+class TestFollowCountsMigration:
+    """Test the migration adding the cached follow counts."""
+
+    def test_backfill_sets_counts_of_existing_profiles(self, request, user_factory):
+        """Test migrating sets the follow counts of profiles that already exist."""
+        if request.config.getoption("nomigrations"):
+            pytest.skip("Needs migrations; run pytest with --migrations.")
+
+        leaf_nodes = MigrationExecutor(connection).loader.graph.leaf_nodes()
+        apps = migrate(BEFORE_COUNTS)
+        try:
+            Profile = apps.get_model("profiles", "Profile")
+            Follow = apps.get_model("profiles", "Follow")
+            profile1, profile2, profile3 = Profile.objects.bulk_create(
+                Profile(user_id=user_factory().pk) for _ in range(3)
+            )
+            Follow.objects.bulk_create(
+                [
+                    Follow(follower=profile1, following=profile2),
+                    Follow(follower=profile1, following=profile3),
+                    Follow(follower=profile2, following=profile3),
+                ]
+            )
+
+            apps = migrate(AFTER_COUNTS)
+
+            Profile = apps.get_model("profiles", "Profile")
+            counts = {
+                pk: (following, followers)
+                for pk, following, followers in Profile.objects.values_list(
+                    "pk", "following_count_cached", "followers_count_cached"
+                )
+            }
+            assert counts == {
+                profile1.pk: (2, 0),
+                profile2.pk: (1, 1),
+                profile3.pk: (0, 2),
+            }
+        finally:
+            migrate(leaf_nodes)
@@ -1,50 +1,39 @@
 from unittest.mock import patch
 
 import pytest
-from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.db.utils import IntegrityError
 from django.utils import timezone
-from model_bakery import baker
 from profiles.models import Follow, Profile, profile_image_file_path
 
-User = get_user_model()
+DATE_FROM_12_YEARS_AGO = timezone.now().date() - timezone.timedelta(days=365 * 12)
 
 
-@pytest.fixture
-def sample_user():
-    """Return a sample user."""
-    return baker.make(User)
+@patch("uuid.uuid4")
+def test_profile_file_name_uuid(mock_uuid):
+    """Test that image is saved in the correct location"""
+    uuid = "testuuid"
+    mock_uuid.return_value.hex = uuid
+    file_path = profile_image_file_path(None, "my_image.JPG")
 
-
-@pytest.fixture
-def sample_payload():
-    """Return sample user information as a payload."""
-    date_from_14_years_ago = timezone.now().date() - timezone.timedelta(days=365 * 14)
-    return {
-        "bio": "sample description",
-        "location": "sample location",
-        "birth_date": date_from_14_years_ago,
-        "website": "https://some-website.com",
-    }
+    exp_path = f"uploads/profile/{uuid}.jpg"
+    assert file_path == exp_path
 
 
 @pytest.mark.django_db
 class TestProfileModel:
-    def test_creating_a_profile_is_successful(self, sample_payload, sample_user):
+    def test_creating_a_profile_is_successful(self, profile_payload, sample_user):
         """Test that profiles are created successfully."""
-        profile = Profile.objects.create(**sample_payload, user=sample_user)
+        profile = Profile.objects.create(**profile_payload, user=sample_user)
 
         assert profile.user == sample_user
-        assert profile.bio == sample_payload.get("bio")
-        assert profile.location == sample_payload.get("location")
-        assert profile.birth_date == sample_payload.get("birth_date")
-        assert profile.website == sample_payload.get("website")
+        assert profile.bio == profile_payload.get("bio")
+        assert profile.location == profile_payload.get("location")
+        assert profile.birth_date == profile_payload.get("birth_date")
+        assert profile.website == profile_payload.get("website")
         assert not profile.is_verified
         assert not profile.is_suspended
-        profile.full_clean()
-        assert Profile.objects.all().count() == 1
 
     def test_create_profile_with_non_required_fields_successful(self, sample_user):
         """Test creating profiles with non required fields is successful."""
@@ -57,33 +46,28 @@ class TestProfileModel:
         assert profile.website is None
         assert not profile.is_verified
         assert not profile.is_suspended
-        profile.full_clean()
-        assert Profile.objects.all().count() == 1
 
     def test_create_profile_without_user_fails(self):
         """Test creating profile without a user fails."""
         with transaction.atomic():
             with pytest.raises(IntegrityError):
                 Profile.objects.create()
-        assert Profile.objects.all().count() == 0
+        assert Profile.objects.count() == 0
 
-    def test_minimum_age_validation(self, sample_payload, sample_user):
+    def test_minimum_age_validation(self, profile_payload, sample_user):
         """Test validating a profile with age less than 13 raises an error."""
-        date_from_12_years_ago = timezone.now().date() - timezone.timedelta(
-            days=365 * 12
-        )
-        sample_payload.update({"birth_date": date_from_12_years_ago})
+        profile_payload.update({"birth_date": DATE_FROM_12_YEARS_AGO})
 
-        profile = Profile.objects.create(**sample_payload, user=sample_user)
+        profile = Profile.objects.create(**profile_payload, user=sample_user)
 
         with pytest.raises(ValidationError):
             profile.full_clean()
 
-    def test_website_field_validation(self, sample_payload, sample_user):
+    def test_website_field_validation(self, profile_payload, sample_user):
         """Test validating profile with invalid url as website raises an error."""
-        sample_payload.update({"website": "invalidurl"})
+        profile_payload.update({"website": "invalidurl"})
 
-        profile = Profile.objects.create(**sample_payload, user=sample_user)
+        profile = Profile.objects.create(**profile_payload, user=sample_user)
 
         with pytest.raises(ValidationError):
             profile.full_clean()
@@ -94,51 +78,43 @@ class TestProfileModel:
 
         assert str(profile) == f"{sample_user.first_name} {sample_user.last_name}"
 
-    @patch("uuid.uuid4")
-    def test_profile_file_name_uuid(self, mock_uuid):
-        """Test that image is saved in the correct location"""
-        uuid = "test-uuid"
-        mock_uuid.return_value = uuid
-        file_path = profile_image_file_path(None, "my_image.jpg")
-
-        exp_path = f"uploads/profile/{uuid}.jpg"
-        assert file_path == exp_path
-
 
 @pytest.mark.django_db
 class TestFollowModel:
-    def test_follow_successful(self):
+    def test_follow_successful(self, user_factory):
         """Test create follow each other successful."""
-        profile1 = baker.make(Profile)
-        profile2 = baker.make(Profile)
-
-        follow = Follow.objects.create(follower=profile1, following=profile2)
-
-        assert follow.follower == profile1
-        assert follow.following == profile2
-        assert str(follow) == f"{profile1.full_name} follows {profile2.full_name}"
-        assert Follow.objects.count() == 1
-
-        follow = Follow.objects.create(follower=profile2, following=profile1)
+        profile1 = Profile.objects.create(user=user_factory())
+        profile2 = Profile.objects.create(user=user_factory())
+
+        follow1, follow2 = Follow.objects.bulk_create(
+            [
+                Follow(follower=profile1, following=profile2),
+                Follow(follower=profile2, following=profile1),
+            ]
+        )
 
-        assert follow.follower == profile2
-        assert follow.following == profile1
-        assert str(follow) == f"{profile2.full_name} follows {profile1.full_name}"
+        assert follow1.pk and follow2.pk
+        assert follow1.follower == profile1
+        assert follow1.following == profile2
+        assert str(follow1) == f"{profile1.full_name} follows {profile2.full_name}"
+        assert follow2.follower == profile2
+        assert follow2.following == profile1
+        assert str(follow2) == f"{profile2.full_name} follows {profile1.full_name}"
         assert Follow.objects.count() == 2
 
-    def test_follow_oneself_fails(self):
+    def test_follow_oneself_fails(self, sample_profile):
         """Test create follow object with same follower and following fails."""
-        profile = baker.make(Profile)
+        profile = sample_profile
 
         with transaction.atomic():
             with pytest.raises(IntegrityError):
                 Follow.objects.create(follower=profile, following=profile)
         assert Follow.objects.count() == 0
 
-    def test_follow_more_than_once_fails(self):
+    def test_follow_more_than_once_fails(self, other_profile, sample_profile):
         """Test one profile following another more than once fails."""
-        follower = baker.make(Profile)
-        following = baker.make(Profile)
+        follower = sample_profile
+        following = other_profile
 
         Follow.objects.create(follower=follower, following=following)
 
@@ -1,6 +1,5 @@
 """Tests for the Profile API."""
-import os
-import tempfile
+from datetime import date
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -8,19 +7,26 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from django.utils import timezone
 from model_bakery import baker
-from PIL import Image
 from profiles.models import Follow, Profile
-from profiles.serializers import (
-    ProfileSerializer,
-    SimpleUserProfileSerializer,
-    UserProfileSerializer,
-)
+from profiles.serializers import SimpleUserProfileSerializer, UserProfileSerializer
+from profiles.views import ProfileViewSet
 from rest_framework import status
 
 User = get_user_model()
 PROFILE_URL = reverse("profiles:profile-list")
 PROFILE_ME_URL = reverse("profiles:profile-me")
 PROFILE_IMAGE_URL = reverse("profiles:profile-upload-image")
+PROFILE_CREATE_VIEW = ProfileViewSet.as_view({"post": "create"})
+PROFILE_ME_VIEW = ProfileViewSet.as_view({"delete": "me", "get": "me", "patch": "me"})
+DATE_FROM_12_YEARS_AGO = timezone.now().date() - timezone.timedelta(days=365 * 12)
+
+
+def assert_profile_data(data, payload, **expected):
+    """Assert that profile response `data` holds every value in `payload`."""
+    for key, value in {**payload, **expected}.items():
+        if isinstance(value, date):
+            value = value.isoformat()
+        assert data.get(key) == value
 
 
 @pytest.mark.django_db
@@ -28,41 +34,33 @@ class TestCreateProfile:
     """Test the user create profile endpoint."""
 
     def test_user_create_profile_returns_201(
-        self, api_client, profile_payload, sample_user
+        self, profile_payload, sample_user, user_client
     ):
         """Test users can create profile."""
-        api_client.force_authenticate(user=sample_user)
+        response = user_client.post(PROFILE_URL, profile_payload)
 
-        response = api_client.post(PROFILE_URL, profile_payload)
-
-        profile = Profile.objects.get(pk=response.data.get("id"))
-        serializer = ProfileSerializer(profile)
-        assert response.data == serializer.data
         assert response.status_code == status.HTTP_201_CREATED
-        assert Profile.objects.all().count() == 1
+        assert_profile_data(response.data, profile_payload, user_id=sample_user.id)
+        assert Profile.objects.count() == 1
 
     def test_user_create_profile_if_exists_returns_400(
-        self, api_client, profile_payload, sample_user
+        self, profile_payload, sample_user, user_client
     ):
         """Test users cannot create a second profile."""
         baker.make(Profile, user=sample_user)
-        api_client.force_authenticate(user=sample_user)
 
-        response = api_client.post(PROFILE_URL, profile_payload)
+        response = user_client.post(PROFILE_URL, profile_payload)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data == {"detail": ["You already have a profile."]}
-        assert Profile.objects.all().count() == 1
+        assert Profile.objects.count() == 1
 
     def test_user_create_profile_under_13_returns_400(
-        self, sample_user, api_client, profile_payload
+        self, api_client, nodb_sample_user, profile_payload
     ):
         """Test user create profile with age under 13 returns an error."""
-        api_client.force_authenticate(user=sample_user)
-        date_from_12_years_ago = timezone.now().date() - timezone.timedelta(
-            days=365 * 12
-        )
-        profile_payload.update({"birth_date": date_from_12_years_ago})
+        api_client.force_authenticate(user=nodb_sample_user)
+        profile_payload.update({"birth_date": DATE_FROM_12_YEARS_AGO})
 
         response = api_client.post(PROFILE_URL, profile_payload)
 
@@ -70,30 +68,30 @@ class TestCreateProfile:
         assert response.data == {
             "birth_date": ["You must be at least 13 years old to use Nexus."]
         }
-        assert Profile.objects.all().count() == 0
+        assert Profile.objects.count() == 0
 
     def test_user_create_profile_with_invalid_website_returns_400(
-        self, api_client, profile_payload, sample_user
+        self, api_client, nodb_sample_user, profile_payload
     ):
         """Test user create profile with invalid website returns an error."""
-        api_client.force_authenticate(user=sample_user)
+        api_client.force_authenticate(user=nodb_sample_user)
         profile_payload.update({"website": "invalid url"})
 
         response = api_client.post(PROFILE_URL, profile_payload)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data == {"website": ["Enter a valid URL."]}
-        assert Profile.objects.all().count() == 0
+        assert Profile.objects.count() == 0
 
     def test_anonymous_user_create_profile_returns_401(
-        self, api_client, profile_payload, unauthorized_response
+        self, api_rf, profile_payload, unauthorized_response
     ):
         """Test anonymous user create profile returns an error."""
-        response = api_client.post(PROFILE_URL, profile_payload)
+        response = PROFILE_CREATE_VIEW(api_rf.post(PROFILE_URL, profile_payload))
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.data == unauthorized_response
-        assert Profile.objects.all().count() == 0
+        assert Profile.objects.count() == 0
 
 
 @pytest.mark.django_db
@@ -101,20 +99,15 @@ class TestRetrieveProfile:
     """Test the retrieve profile endpoint."""
 
     def test_get_profile_list_returns_405(
-        self,
-        api_client,
-        not_allowed_response,
-        sample_user,
+        self, not_allowed_response, profile_factory, user_client
     ):
         """Test get profile list not allowed."""
-        api_client.force_authenticate(user=sample_user)
-        baker.make(Profile, _quantity=3)
+        profile_factory(3)
 
-        response = api_client.get(PROFILE_URL)
+        response = user_client.get(PROFILE_URL)
 
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
         assert response.data == not_allowed_response("GET")
-        assert Profile.objects.all().count() == 3
 
     def test_anonymous_user_retrieve_profile_detail_returns_200(
         self,
@@ -128,7 +121,6 @@ class TestRetrieveProfile:
         response = api_client.get(detail_url(profile.id))
 
         assert response.status_code == status.HTTP_200_OK
-        assert Profile.objects.all().count() == 1
         assert "is_following" not in response.data
         assert "follows_you" not in response.data
         assert response.data.get("following_count") == 0
@@ -140,75 +132,53 @@ class TestRetrieveProfile:
         serializer = UserProfileSerializer(profile)
         assert response.data == serializer.data
 
-    def test_is_following_field(
-        self, api_client, detail_url, pop_extra_keys, sample_profile, sample_user
+    @pytest.mark.parametrize(
+        "is_following, follows_you", [(True, False), (False, True), (True, True)]
+    )
+    def test_is_following_and_follows_you_fields(
+        self,
+        detail_url,
+        follows_you,
+        is_following,
+        pop_extra_keys,
+        sample_profile,
+        user_client,
     ):
-        """Test is_following field on get profile."""
-        api_client.force_authenticate(user=sample_user)
+        """Test is_following and follows_you fields on get profile."""
         profile = baker.make(Profile)
-        sample_profile.follows.add(profile)
+        if is_following:
+            sample_profile.follows.add(profile)
+        if follows_you:
+            sample_profile.followed_by.add(profile)
 
-        response = api_client.get(detail_url(profile.id))
+        response = user_client.get(detail_url(profile.id))
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data.get("is_following")
-        assert not response.data.get("follows_you")
-        assert response.data.get("following_count") == 0
-        assert response.data.get("followers_count") == 1
-        assert Profile.objects.all().count() == 2
-        assert Follow.objects.count() == 1
+        assert response.data.get("is_following") is is_following
+        assert response.data.get("follows_you") is follows_you
+        assert response.data.get("following_count") == int(follows_you)
+        assert response.data.get("followers_count") == int(is_following)
+        assert Follow.objects.count() == is_following + follows_you
 
         # pop the extra keys for serializer.data comparison:
         response.data = pop_extra_keys(response.data)
         serializer = UserProfileSerializer(profile)
         assert response.data == serializer.data
 
-    def test_follows_you_field(
-        self, api_client, detail_url, pop_extra_keys, sample_profile, sample_user
-    ):
-        """Test follows_you fields on get profile."""
-        api_client.force_authenticate(user=sample_user)
-        profile = baker.make(Profile)
-        sample_profile.followed_by.add(profile)
-
-        response = api_client.get(detail_url(profile.id))
-
-        assert response.status_code == status.HTTP_200_OK
-        assert not response.data.get("is_following")
-        assert response.data.get("follows_you")
-        assert response.data.get("following_count") == 1
-        assert response.data.get("followers_count") == 0
-        assert Profile.objects.all().count() == 2
-        assert Follow.objects.count() == 1
-
-        # pop the extra keys for serializer.data comparison:
-        serializer = UserProfileSerializer(profile)
-        response.data = pop_extra_keys(response.data)
-        assert response.data == serializer.data
-
-    def test_is_following_and_follows_you_fields(
-        self, api_client, detail_url, pop_extra_keys, sample_profile, sample_user
+    def test_retrieve_profile_fetches_follow_info_in_one_query(
+        self, detail_url, django_assert_num_queries, sample_profile, user_client
     ):
-        """Test is_following and follows_you fields on get profile."""
-        api_client.force_authenticate(user=sample_user)
+        """Test follow fields and counts are fetched with the retrieved profile."""
         profile = baker.make(Profile)
         sample_profile.follows.add(profile)
-        sample_profile.followed_by.add(profile)
 
-        response = api_client.get(detail_url(profile.id))
+        # One query for the current user's profile and one for the retrieved one.
+        with django_assert_num_queries(2):
+            response = user_client.get(detail_url(profile.id))
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data.get("is_following")
-        assert response.data.get("follows_you")
-        assert response.data.get("following_count") == 1
         assert response.data.get("followers_count") == 1
-        assert Profile.objects.all().count() == 2
-        assert Follow.objects.count() == 2
-
-        # pop the extra keys for serializer.data comparison:
-        serializer = UserProfileSerializer(profile)
-        response.data = pop_extra_keys(response.data)
-        assert response.data == serializer.data
 
 
 @pytest.mark.django_db
@@ -216,12 +186,10 @@ class TestRetrieveProfileMe:
     """Test retrieve current user profile."""
 
     def test_user_retrieve_profile_detail_returns_200(
-        self, api_client, sample_user, sample_profile
+        self, sample_profile, user_client
     ):
         """Test user can retrieve profile detail."""
-        api_client.force_authenticate(user=sample_user)
-
-        response = api_client.get(PROFILE_ME_URL)
+        response = user_client.get(PROFILE_ME_URL)
 
         serializer = UserProfileSerializer(sample_profile)
         assert response.data == serializer.data
@@ -229,40 +197,42 @@ class TestRetrieveProfileMe:
         assert not response.data.get("follows_you")
         assert len(response.data.get("user")) == 4
         assert response.status_code == status.HTTP_200_OK
-        assert Profile.objects.all().count() == 1
+        assert Profile.objects.count() == 1
+
+    def test_retrieve_profile_fetches_user_in_one_query(
+        self, django_assert_num_queries, sample_profile, sample_user, user_client
+    ):
+        """Test the profile and its user are fetched with a single query."""
+        with django_assert_num_queries(1):
+            response = user_client.get(PROFILE_ME_URL)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data.get("user").get("username") == sample_user.username
 
     def test_create_profile_for_user_if_not_exist_on_get_profile(
-        self, api_client, sample_user
+        self, sample_user, user_client
     ):
         """
         Test a profile is created if one does not exist for a user who tries to get
         their profile.
         """
-        api_client.force_authenticate(user=sample_user)
-        assert Profile.objects.all().count() == 0
-
-        response = api_client.get(PROFILE_ME_URL)
+        response = user_client.get(PROFILE_ME_URL)
 
-        profile = Profile.objects.get(pk=response.data.get("id"))
-        serializer = UserProfileSerializer(profile)
-        assert response.data == serializer.data
         assert response.status_code == status.HTTP_200_OK
-        assert profile.user == sample_user
-        assert Profile.objects.all().count() == 1
+        assert response.data.get("user").get("username") == sample_user.username
+        assert Profile.objects.filter(
+            pk=response.data.get("id"), user=sample_user
+        ).exists()
+        assert Profile.objects.count() == 1
 
     def test_anonymous_user_retrieve_profile_detail_returns_401(
-        self, api_client, unauthorized_response
+        self, api_rf, unauthorized_response
     ):
         """Test anonymous user retrieve profile detail returns error."""
-        profile = baker.make(Profile)
+        response = PROFILE_ME_VIEW(api_rf.get(PROFILE_ME_URL))
 
-        response = api_client.get(PROFILE_ME_URL)
-
-        serializer = ProfileSerializer(profile)
-        assert response.data != serializer.data
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.data == unauthorized_response
-        assert Profile.objects.all().count() == 1
 
 
 @pytest.mark.django_db
@@ -270,54 +240,40 @@ class TestUpdateProfileMe:
     """Test update current user's profile."""
 
     def test_user_update_profile_returns_200(
-        self, api_client, profile_payload, sample_user
+        self, profile_payload, sample_user, user_client
     ):
         """Test authenticated user can update his profile."""
-        api_client.force_authenticate(user=sample_user)
         profile = baker.make(Profile, user=sample_user)
 
-        response = api_client.patch(PROFILE_ME_URL, profile_payload)
+        response = user_client.patch(PROFILE_ME_URL, profile_payload)
 
-        profile.refresh_from_db()
-        serializer = ProfileSerializer(profile)
-        assert response.data == serializer.data
         assert response.status_code == status.HTTP_200_OK
-        assert profile.user == sample_user
-        assert profile.bio == profile_payload.get("bio")
-        assert profile.birth_date == profile_payload.get("birth_date")
-        assert profile.website == profile_payload.get("website")
-        assert profile.location == profile_payload.get("location")
-        assert Profile.objects.all().count() == 1
+        assert_profile_data(response.data, profile_payload, id=profile.id)
+        assert Profile.objects.filter(
+            pk=profile.pk, user=sample_user, **profile_payload
+        ).exists()
+        assert Profile.objects.count() == 1
 
     def test_create_profile_for_user_if_not_exist_on_update_profile(
-        self, api_client, profile_payload, sample_user
+        self, profile_payload, sample_user, user_client
     ):
         """
         Test a profile is created if one does not exist for a user who tries to update
         their profile.
         """
-        api_client.force_authenticate(user=sample_user)
-
-        assert Profile.objects.all().count() == 0
-
-        response = api_client.patch(PROFILE_ME_URL, profile_payload)
+        response = user_client.patch(PROFILE_ME_URL, profile_payload)
 
-        profile = Profile.objects.get(pk=response.data.get("id"))
-        serializer = ProfileSerializer(profile)
-        assert response.data == serializer.data
         assert response.status_code == status.HTTP_200_OK
-        assert profile.user == sample_user
-        assert profile.bio == profile_payload.get("bio")
-        assert profile.birth_date == profile_payload.get("birth_date")
-        assert profile.website == profile_payload.get("website")
-        assert profile.location == profile_payload.get("location")
-        assert Profile.objects.all().count() == 1
+        assert_profile_data(response.data, profile_payload, user_id=sample_user.id)
+        assert Profile.objects.filter(
+            pk=response.data.get("id"), user=sample_user, **profile_payload
+        ).exists()
+        assert Profile.objects.count() == 1
 
     def test_user_full_update_profile_returns_405(
-        self, api_client, profile_payload, not_allowed_response, sample_user
+        self, not_allowed_response, profile_payload, sample_user, user_client
     ):
         """Test user cannot fully update profile."""
-        api_client.force_authenticate(user=sample_user)
         old_payload = {
             "user_id": sample_user.id,
             "bio": "old bio",
@@ -328,19 +284,15 @@ class TestUpdateProfileMe:
         profile = baker.make(Profile, **old_payload)
         new_payload = profile_payload
 
-        response = api_client.put(PROFILE_ME_URL, new_payload)
+        response = user_client.put(PROFILE_ME_URL, new_payload)
 
-        profile.refresh_from_db()
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
         assert response.data == not_allowed_response("PUT")
-        profile.bio = old_payload.get("bio")
-        profile.birth_date = old_payload.get("birth_date")
-        profile.website = old_payload.get("website")
-        profile.location = old_payload.get("location")
-        assert Profile.objects.all().count() == 1
+        assert Profile.objects.filter(pk=profile.pk, **old_payload).exists()
+        assert Profile.objects.count() == 1
 
     def test_anonymous_user_update_profile_returns_401(
-        self, api_client, profile_payload, sample_user, unauthorized_response
+        self, api_rf, profile_payload, sample_user, unauthorized_response
     ):
         """Test anonymous user cannot update a user profile."""
         old_payload = {
@@ -353,59 +305,47 @@ class TestUpdateProfileMe:
         profile = baker.make(Profile, **old_payload)
         new_payload = profile_payload
 
-        response = api_client.patch(PROFILE_ME_URL, new_payload)
+        response = PROFILE_ME_VIEW(api_rf.patch(PROFILE_ME_URL, new_payload))
 
-        profile.refresh_from_db()
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.data == unauthorized_response
-        profile.bio = old_payload.get("bio")
-        profile.birth_date = old_payload.get("birth_date")
-        profile.website = old_payload.get("website")
-        profile.location = old_payload.get("location")
-        assert Profile.objects.all().count() == 1
+        assert Profile.objects.filter(pk=profile.pk, **old_payload).exists()
+        assert Profile.objects.count() == 1
 
 
 @pytest.mark.django_db
 class TestDeleteProfileMe:
     """Test delete current user profile."""
 
-    def test_user_delete_profile_returns_204(
-        self, api_client, sample_user, sample_profile
-    ):
+    def test_user_delete_profile_returns_204(self, sample_profile, user_client):
         """Test user can delete profile."""
-        api_client.force_authenticate(user=sample_user)
-        assert Profile.objects.all().count() == 1
-
-        response = api_client.delete(PROFILE_ME_URL)
+        response = user_client.delete(PROFILE_ME_URL)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not response.data
-        assert Profile.objects.all().count() == 0
+        assert Profile.objects.count() == 0
 
     def test_user_delete_non_existent_profile_404(
-        self, api_client, not_found_response, sample_user
+        self, not_found_response, user_client
     ):
         """Test user delete profile returns error if profile does not exist."""
-        api_client.force_authenticate(user=sample_user)
-        assert Profile.objects.all().count() == 0
-
-        response = api_client.delete(PROFILE_ME_URL)
+        response = user_client.delete(PROFILE_ME_URL)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data == not_found_response
-        assert Profile.objects.all().count() == 0
+        assert Profile.objects.count() == 0
 
     def test_anonymous_user_delete_profile_returns_401(
-        self, api_client, unauthorized_response
+        self, api_rf, unauthorized_response
     ):
         """Test anonymous user delete profile returns error."""
         baker.make(Profile)
 
-        response = api_client.delete(PROFILE_ME_URL)
+        response = PROFILE_ME_VIEW(api_rf.delete(PROFILE_ME_URL))
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.data == unauthorized_response
-        assert Profile.objects.all().count() == 1
+        assert Profile.objects.count() == 1
 
 
 @pytest.mark.django_db
@@ -414,27 +354,28 @@ class TestRetrieveFollowLists:
 
     def test_list_a_profiles_followers_returns_200(
         self,
-        api_client,
         followers_list_url,
         other_profile,
         pop_extra_keys,
+        profile_factory,
         sample_profile,
-        sample_user,
+        user_client,
     ):
         """Test retrieve list of profiles; following a profile."""
-        baker.make(Profile)
-        profile = baker.make(Profile)
-        other_profile.followed_by.add(profile)
-        other_profile.followed_by.add(sample_profile)
+        _, profile = profile_factory(2)
+        Follow.objects.bulk_create(
+            [
+                Follow(follower=profile, following=other_profile),
+                Follow(follower=sample_profile, following=other_profile),
+            ]
+        )
         url = followers_list_url(other_profile.id)
-        api_client.force_authenticate(user=sample_user)
 
-        response = api_client.get(url)
+        response = user_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data.get("count") == Follow.objects.count() == 2
-        assert Profile.objects.count() == 4
         results = response.data.get("results")
+        assert len(results) == Follow.objects.count() == 2
         for follower in results:
             assert len(follower.get("user")) == 3
             assert follower.get("id") in [profile.id, sample_profile.id]
@@ -448,45 +389,73 @@ class TestRetrieveFollowLists:
         serializer = SimpleUserProfileSerializer(followers, many=True)
         assert results == serializer.data
 
-    def test_anonymous_user_list_a_profiles_followers_returns_401(
-        self,
-        api_client,
-        followers_list_url,
-        sample_profile,
-        unauthorized_response,
+    def test_list_followers_is_paginated_by_cursor(
+        self, followers_list_url, other_profile, profile_factory, user_client
     ):
-        """Test anonymous user list profile followers returns error."""
-        url = followers_list_url(sample_profile.id)
+        """Test long follower lists are split into pages linked by cursors."""
+        followers = profile_factory(41)
+        Follow.objects.bulk_create(
+            Follow(follower=follower, following=other_profile)
+            for follower in followers
+        )
 
-        response = api_client.get(url)
+        response = user_client.get(followers_list_url(other_profile.id))
+        next_response = user_client.get(response.data.get("next"))
+
+        assert response.status_code == next_response.status_code == status.HTTP_200_OK
+        assert len(response.data.get("results")) == 40
+        assert response.data.get("previous") is None
+        assert next_response.data.get("next") is None
+        ids = [
+            profile.get("id")
+            for page in (response, next_response)
+            for profile in page.data.get("results")
+        ]
+        assert ids == sorted(follower.id for follower in followers)
+
+    def test_list_own_followers_marks_them_as_following_you(
+        self, followers_list_url, other_profile, sample_profile, user_client
+    ):
+        """Test listing the current user's followers sets follows_you."""
+        Follow.objects.bulk_create(
+            [
+                Follow(follower=other_profile, following=sample_profile),
+                Follow(follower=sample_profile, following=other_profile),
+            ]
+        )
 
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        assert response.data == unauthorized_response
-        assert Profile.objects.count() == 1
+        response = user_client.get(followers_list_url(sample_profile.id))
+
+        assert response.status_code == status.HTTP_200_OK
+        (follower,) = response.data.get("results")
+        assert follower.get("id") == other_profile.id
+        assert follower.get("follows_you") is True
+        assert follower.get("is_following") is True
 
     def test_list_a_profiles_following_returns_200(
         self,
-        api_client,
         following_list_url,
         other_profile,
         pop_extra_keys,
+        profile_factory,
         sample_profile,
-        sample_user,
+        user_client,
     ):
         """Test retrieve list of profiles; a profile is following."""
-        baker.make(Profile)
-        profile = baker.make(Profile)
-        other_profile.follows.add(profile)
-        other_profile.follows.add(sample_profile)
+        _, profile = profile_factory(2)
+        Follow.objects.bulk_create(
+            [
+                Follow(follower=other_profile, following=profile),
+                Follow(follower=other_profile, following=sample_profile),
+            ]
+        )
         url = following_list_url(other_profile.id)
-        api_client.force_authenticate(user=sample_user)
 
-        response = api_client.get(url)
+        response = user_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data.get("count") == Follow.objects.count() == 2
-        assert Profile.objects.count() == 4
         results = response.data.get("results")
+        assert len(results) == Follow.objects.count() == 2
         for follower in results:
             assert follower.get("id") in [profile.id, sample_profile.id]
             assert not follower.get("follows_you")
@@ -499,55 +468,40 @@ class TestRetrieveFollowLists:
         serializer = SimpleUserProfileSerializer(following, many=True)
         assert results == serializer.data
 
-    def test_anonymous_user_list_a_profiles_following_returns_401(
-        self,
-        api_client,
-        following_list_url,
-        sample_profile,
-        unauthorized_response,
-    ):
-        """Test anonymous user list profile following returns error."""
-        url = following_list_url(sample_profile.id)
-
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        assert response.data == unauthorized_response
-        assert Profile.objects.count() == 1
-
     def test_retrieve_profile_list_of_followers_i_know_returns_200(
         self,
-        api_client,
-        sample_profile,
         followers_i_know_list_url,
         other_profile,
         pop_extra_keys,
-        sample_user,
+        profile_factory,
+        sample_profile,
+        user_client,
     ):
         """
         Test retrieve list of profiles the current profile follows,
         among a profile's followers.
         """
         # Create 3 profiles:
-        profile1 = baker.make(Profile)
-        profile2 = baker.make(Profile)
-        profile3 = baker.make(Profile)
-        # They all follow other_profile:
-        other_profile.followed_by.add(profile1)
-        other_profile.followed_by.add(profile2)
-        other_profile.followed_by.add(profile3)
-        # Sample_profile follows profile1 and profile2 but not profile3:
-        sample_profile.follows.add(profile1)
-        sample_profile.follows.add(profile2)
+        profile1, profile2, profile3 = profile_factory(3)
+        Follow.objects.bulk_create(
+            [
+                # They all follow other_profile:
+                Follow(follower=profile1, following=other_profile),
+                Follow(follower=profile2, following=other_profile),
+                Follow(follower=profile3, following=other_profile),
+                # Sample_profile follows profile1 and profile2 but not profile3:
+                Follow(follower=sample_profile, following=profile1),
+                Follow(follower=sample_profile, following=profile2),
+            ]
+        )
 
         url = followers_i_know_list_url(other_profile.id)
-        api_client.force_authenticate(user=sample_user)
 
-        response = api_client.get(url)
+        response = user_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert Follow.objects.count() == 5
-        assert response.data.get("count") == 2
+        assert len(response.data.get("results")) == 2
         profiles_i_follow = sample_profile.follows.all()
         followers_i_know = other_profile.followed_by.filter(
             id__in=profiles_i_follow
@@ -565,94 +519,67 @@ class TestRetrieveFollowLists:
         serializer = SimpleUserProfileSerializer(followers_i_know, many=True)
         assert results == serializer.data
 
-    def test_anonymous_user_list_profiles_i_know_returns_401(
-        self,
-        api_client,
-        followers_i_know_list_url,
-        sample_profile,
-        unauthorized_response,
-    ):
-        """Test anonymous user list profile following returns error."""
-        url = followers_i_know_list_url(sample_profile.id)
-
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        assert response.data == unauthorized_response
-        assert Profile.objects.count() == 1
-
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures("media_root")
 class TestProfileImageUpload:
     """Test profile image upload endpoint."""
 
-    def test_upload_image_to_profile_returns_200(self, api_client, sample_user):
-        """Test uploading an image to profile."""
-        api_client.force_authenticate(user=sample_user)
-        baker.make(Profile, user=sample_user)
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
-            img = Image.new("RGB", (10, 10))
-            img.save(ntf, format="JPEG")
-            ntf.seek(0)
+    @pytest.mark.parametrize("profile_exists", [True, False])
+    def test_upload_image_to_profile_returns_200(
+        self, jpeg_upload, profile_exists, sample_user, user_client
+    ):
+        """Test uploading an image, creating the profile if it does not exist."""
+        if profile_exists:
+            baker.make(Profile, user=sample_user)
 
-            response = api_client.post(
-                PROFILE_IMAGE_URL, {"image": ntf}, format="multipart"
-            )
+        response = user_client.post(
+            PROFILE_IMAGE_URL, {"image": jpeg_upload}, format="multipart"
+        )
 
         profile = Profile.objects.get(pk=response.data.get("id"))
         assert response.status_code == status.HTTP_200_OK
         assert "image" in response.data
-        assert os.path.exists(profile.image.path)
+        assert profile.image.storage.exists(profile.image.name)
         assert Profile.objects.count() == 1
-        os.remove(profile.image.path)
 
-    def test_upload_large_image_to_profile_returns_400(self, api_client, sample_user):
+    def test_upload_large_image_to_profile_returns_400(
+        self, jpeg_upload, sample_user, user_client
+    ):
         """Test uploading large image fails."""
-        api_client.force_authenticate(user=sample_user)
         profile = baker.make(Profile, user=sample_user)
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
-            img = Image.new("RGB", (10, 10))
-            img.save(ntf, format="JPEG")
-            ntf.seek(0)
 
-            # Create a file that is more than 1 MB
-            large_file = SimpleUploadedFile("large_file.jpg", ntf.read() * 2000)
+        # Pad a valid JPEG with zero bytes to just over 1 MB
+        large_image = jpeg_upload.read().ljust(1024 * 1024 + 1, b"\0")
+        large_file = SimpleUploadedFile("large_file.jpg", large_image)
 
-            # Attempt to upload the file and check that an error is returned
-            response = api_client.post(
-                PROFILE_IMAGE_URL, {"image": large_file}, format="multipart"
-            )
+        # Attempt to upload the file and check that an error is returned
+        response = user_client.post(
+            PROFILE_IMAGE_URL, {"image": large_file}, format="multipart"
+        )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data == {"image": ["The image cannot be larger than 1MB."]}
         assert not profile.image
 
-    def test_profile_created_if_not_exists_on_image_upload(
-        self, api_client, sample_user
+    def test_upload_large_file_is_rejected_before_image_validation(
+        self, sample_user, user_client
     ):
-        """Test profile is created if not exists on image upload."""
-        api_client.force_authenticate(user=sample_user)
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
-            img = Image.new("RGB", (10, 10))
-            img.save(ntf, format="JPEG")
-            ntf.seek(0)
+        """Test an oversized upload fails on its size, even if not an image."""
+        profile = baker.make(Profile, user=sample_user)
+        large_file = SimpleUploadedFile("large_file.jpg", b"\0" * (1024 * 1024 + 1))
 
-            response = api_client.post(
-                PROFILE_IMAGE_URL, {"image": ntf}, format="multipart"
-            )
+        response = user_client.post(
+            PROFILE_IMAGE_URL, {"image": large_file}, format="multipart"
+        )
 
-        profile = Profile.objects.get(pk=response.data.get("id"))
-        assert response.status_code == status.HTTP_200_OK
-        assert "image" in response.data
-        assert os.path.exists(profile.image.path)
-        assert Profile.objects.count() == 1
-        os.remove(profile.image.path)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"image": ["The image cannot be larger than 1MB."]}
+        assert not profile.image
 
-    def test_upload_invalid_image_returns_400(self, api_client, sample_user):
+    def test_upload_invalid_image_returns_400(self, user_client):
         """Test uploading an invalid image."""
-        api_client.force_authenticate(user=sample_user)
-
-        response = api_client.post(
+        response = user_client.post(
             PROFILE_IMAGE_URL, {"image": "not_an_image"}, format="multipart"
         )
 
@@ -663,18 +590,33 @@ class TestProfileImageUpload:
             ]
         }
 
+
+class TestAnonymousProfileRequests:
+    """Test anonymous requests rejected before the database is queried."""
+
+    @pytest.mark.parametrize(
+        "list_url",
+        ["followers_list_url", "following_list_url", "followers_i_know_list_url"],
+    )
+    def test_anonymous_user_list_follows_returns_401(
+        self, api_client, list_url, request, unauthorized_response
+    ):
+        """Test anonymous users cannot list any of a profile's follow lists."""
+        # The request is rejected before the profile is looked up.
+        url = request.getfixturevalue(list_url)(1)
+
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data == unauthorized_response
+
     def test_anonymous_user_upload_profile_image_returns_401(
-        self, api_client, unauthorized_response
+        self, api_client, jpeg_upload, unauthorized_response
     ):
         """Test anonymous user cannot upload profile image."""
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
-            img = Image.new("RGB", (10, 10))
-            img.save(ntf, format="JPEG")
-            ntf.seek(0)
-
-            response = api_client.post(
-                PROFILE_IMAGE_URL, {"image": ntf}, format="multipart"
-            )
+        response = api_client.post(
+            PROFILE_IMAGE_URL, {"image": jpeg_upload}, format="multipart"
+        )
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         assert response.data == unauthorized_response
@@ -0,0 +1,25 @@
+"""Tests for the Profiles app serializers."""
+import pytest
+from model_bakery import baker
+from profiles.models import Profile
+from profiles.serializers import (
+    SimpleUserProfileSerializer,
+    serialize_simple_user_profiles,
+)
+from rest_framework.test import APIRequestFactory
+
+
+@pytest.mark.django_db
+def test_serialize_simple_user_profiles_matches_serializer():
+    """Test the fast profile list representation matches the serializer's."""
+    profiles = baker.make(Profile, _quantity=2) + [baker.make(Profile, image="a.jpg")]
+    for profile, is_following in zip(profiles, [True, False, None]):
+        profile.is_following = is_following
+        profile.follows_you = not is_following
+    request = APIRequestFactory().get("/")
+
+    serializer = SimpleUserProfileSerializer(
+        profiles, many=True, context={"request": request}
+    )
+
+    assert serialize_simple_user_profiles(profiles, request) == serializer.data
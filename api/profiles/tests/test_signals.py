@@ -0,0 +1,58 @@
+"""Tests for the profiles app signal handlers."""
+import pytest
+from model_bakery import baker
+from profiles.models import Follow, Profile
+
+
+@pytest.mark.django_db
+class TestCachedFollowCounts:
+    """Test the cached follow counts follow the Follow table."""
+
+    def test_creating_and_deleting_follow_updates_counts(
+        self, other_profile, sample_profile
+    ):
+        """Test creating and deleting a follow updates both profiles' counts."""
+        follow = Follow.objects.create(follower=sample_profile, following=other_profile)
+
+        sample_profile.refresh_from_db()
+        other_profile.refresh_from_db()
+        assert sample_profile.following_count_cached == 1
+        assert other_profile.followers_count_cached == 1
+
+        follow.delete()
+
+        sample_profile.refresh_from_db()
+        other_profile.refresh_from_db()
+        assert sample_profile.following_count_cached == 0
+        assert other_profile.followers_count_cached == 0
+
+    def test_adding_follows_through_managers_updates_counts(
+        self, profile_factory, sample_profile
+    ):
+        """Test follows added via follows and followed_by update counts."""
+        profile1, profile2 = profile_factory(2)
+
+        sample_profile.follows.add(profile1, profile2)
+        sample_profile.followed_by.add(profile1)
+
+        sample_profile.refresh_from_db()
+        profile1.refresh_from_db()
+        profile2.refresh_from_db()
+        assert sample_profile.following_count_cached == 2
+        assert sample_profile.followers_count_cached == 1
+        assert profile1.following_count_cached == 1
+        assert profile1.followers_count_cached == 1
+        assert profile2.followers_count_cached == 1
+
+    def test_removing_follows_through_managers_updates_counts(self, sample_profile):
+        """Test follows removed via follows update counts."""
+        profile = baker.make(Profile)
+        sample_profile.follows.add(profile)
+
+        sample_profile.follows.remove(profile)
+
+        sample_profile.refresh_from_db()
+        profile.refresh_from_db()
+        assert sample_profile.following_count_cached == 0
+        assert profile.followers_count_cached == 0
+
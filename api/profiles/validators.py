@@ -1,6 +1,8 @@
 """validators for the profile app."""
+import datetime
+import functools
+
 from django.core.exceptions import ValidationError
-from django.utils import timezone
 
 
 def validate_image_size(file):
@@ -12,11 +14,19 @@ def validate_image_size(file):
         )
 
 
+@functools.lru_cache(maxsize=1)
+def get_latest_allowed_birth_date(today):
+    """Return the latest birth date of someone who is at least 13 on `today`."""
+    try:
+        return today.replace(year=today.year - 13)
+    except ValueError:
+        # Today is February 29th and 13 years ago was not a leap year.
+        return today.replace(year=today.year - 13, day=28)
+
+
 def validate_age(value):
     """Ensure user is at least 13 years of age."""
-    today = timezone.now().date()
-    age = (
-        today.year - value.year - ((today.month, today.day) < (value.month, value.day))
-    )
-    if age < 13:
+    # Django sets the process time zone to TIME_ZONE, so there is no need for
+    # timezone-aware dates here.
+    if value > get_latest_allowed_birth_date(datetime.date.today()):
         raise ValidationError("You must be at least 13 years old to use Nexus.")
@@ -1,14 +1,15 @@
 """Views for the Profiles app."""
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import mixins, status
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from .helpers import ProfileViewSetHelper
+from .helpers import ProfileViewSetHelper, get_request_profile
 from .models import Follow, Profile
+from .pagination import ProfileListCursorPagination
 from .serializers import (
     CreateFollowSerializer,
     ProfileImageSerializer,
@@ -26,7 +27,7 @@ class ProfileViewSet(
 ):
     """The Profile view set."""
 
-    pagination_class = PageNumberPagination
+    pagination_class = ProfileListCursorPagination
     permission_classes = [IsAuthenticated]
     queryset = Profile.objects.all()
 
@@ -71,7 +72,13 @@ class ProfileViewSet(
     )
     def me(self, request):
         """Me action to manage current user's profile."""
-        current_profile = self.get_me_object()
+        if request.method == "DELETE":
+            deleted, _ = Profile.objects.filter(user=request.user).delete()
+            if not deleted:
+                raise Http404
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        current_profile = self.get_or_create_current_profile()
         if request.method == "GET":
             serializer = self.get_serializer(current_profile)
             return Response(serializer.data, status=status.HTTP_200_OK)
@@ -80,29 +87,24 @@ class ProfileViewSet(
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data, status=status.HTTP_200_OK)
-        elif request.method == "DELETE":
-            current_profile.delete()
-            return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(methods=["GET"], detail=True, permission_classes=[IsAuthenticated])
     def followers(self, request, pk=None):
         """List followers of any profile."""
-        followers = (
-            Follow.objects.filter(following=self.get_object())
-            .select_related("follower")
-            .values_list("follower", flat=True)
-        )
-        return self.get_profiles_in_queryset(followers)
+        profile = self.get_object()
+        followers = Profile.objects.filter(follows=profile)
+        # Everyone listed follows the current user if the profile is their own.
+        follows_you = True if self.is_current_profile(profile) else None
+        return self.get_profiles_in_queryset(followers, follows_you=follows_you)
 
     @action(methods=["GET"], detail=True, permission_classes=[IsAuthenticated])
     def following(self, request, pk=None):
         """List following of any profile."""
-        following = (
-            Follow.objects.filter(follower=self.get_object())
-            .select_related("following")
-            .values_list("following", flat=True)
-        )
-        return self.get_profiles_in_queryset(following)
+        profile = self.get_object()
+        following = Profile.objects.filter(followed_by=profile)
+        # The current user follows everyone listed if the profile is their own.
+        is_following = True if self.is_current_profile(profile) else None
+        return self.get_profiles_in_queryset(following, is_following=is_following)
 
     @action(
         methods=["GET"],
@@ -112,19 +114,11 @@ class ProfileViewSet(
     )
     def followers_i_know(self, request, pk=None):
         """List followers_i_know of any profile."""
-        current_profile_following = (
-            Follow.objects.filter(follower=self.get_current_profile())
-            .select_related("following")
-            .values_list("following", flat=True)
-        )
-        followers = (
-            Follow.objects.filter(following=self.get_object())
-            .select_related("follower")
-            .values_list("follower", flat=True)
+        followers_i_know = Profile.objects.filter(
+            follows=self.get_object(), followed_by=self.get_current_profile()
         )
-
-        followers_i_know = followers.intersection(current_profile_following)
-        return self.get_profiles_in_queryset(followers_i_know)
+        # The current user follows everyone listed, by definition.
+        return self.get_profiles_in_queryset(followers_i_know, is_following=True)
 
     @action(
         methods=["POST"],
@@ -134,7 +128,7 @@ class ProfileViewSet(
     )
     def upload_image(self, request, pk=None):
         """Upload an image to current user's profile."""
-        profile, _ = Profile.objects.get_or_create(user=request.user)
+        profile = self.get_or_create_current_profile()
         serializer = self.get_serializer(profile, data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
@@ -154,9 +148,9 @@ class FollowViewSet(
 
     def get_current_profile(self):
         """Return the current user's profile."""
-        if not hasattr(self, "_current_profile"):
-            self._current_profile = Profile.objects.get(user=self.request.user)
-        return self._current_profile
+        return get_request_profile(self.request) or Profile.objects.get(
+            user=self.request.user
+        )
 
     def get_object(self):
         """Return the follow object for the current user and requested profile."""
@@ -398,7 +398,7 @@ class TestUser:
         assert response.status_code == status.HTTP_200_OK
         assert response.data == serializer.data
 
-    def test_anonymous_user_get_user_info_returns_401(self, api_client, sample_user):
+    def test_anonymous_user_get_user_info_returns_401(self, api_client):
         """Test anonymous user retrieve user returns error."""
         response = api_client.get(USER_URL)
 
@@ -407,8 +407,6 @@ class TestUser:
             response.data.get("detail")
             == "Authentication credentials were not provided."
         )
-        serializer = UserSerializer(sample_user)
-        assert response.data != serializer.data
 
     def test_full_update_user(self, api_client, sample_user):
         """Test full update user successful."""
@@ -499,8 +497,6 @@ class TestUser:
             == "Authentication credentials were not provided."
         )
         sample_user.refresh_from_db()
-        serializer = UserSerializer(sample_user)
-        assert response.data != serializer.data
         assert sample_user.email == old_email
         assert sample_user.first_name == old_name
         assert sample_user.is_active